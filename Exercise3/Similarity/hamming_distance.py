@@ -1,3 +1,37 @@
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; fall back to the NumPy comparison.
+    njit = None
+
+# Strings shorter than this are compared with NumPy directly, since starting
+# the parallel Numba kernel costs more than the comparison itself.
+_NJIT_MIN_LENGTH = 1 << 16
+
+if njit is not None:
+    # The kernel is compiled on the first string of _NJIT_MIN_LENGTH or more
+    # characters rather than at import, and cached on disk so that later
+    # processes load it instead of compiling it again.
+    @njit(parallel=True, fastmath=True, boundscheck=False, cache=True)
+    def _hamming_njit(codes_a, codes_b):
+        """
+        Counts the positions at which two equal-length code point arrays differ.
+
+        Args:
+            codes_a (np.ndarray): First array of character codes.
+            codes_b (np.ndarray): Second array of character codes.
+
+        Returns:
+            int: The number of mismatching positions.
+        """
+        mismatches = 0
+        for i in prange(codes_a.size):
+            if codes_a[i] != codes_b[i]:
+                mismatches += 1
+        return mismatches
+
+
 def calculate_hamming_distance(string_a: str, string_b: str) -> int:
     """
     Calculates the Hamming distance between two strings.
@@ -27,5 +61,46 @@ def calculate_hamming_distance(string_a: str, string_b: str) -> int:
     if len(string_a) != len(string_b):
         raise ValueError("For Hamming distance, both strings must be of the same length.")
 
-    # Calculate the distance by summing the positions where characters differ.
-    return sum(1 for char_a, char_b in zip(string_a, string_b) if char_a != char_b)
\ No newline at end of file
+    # Compare the strings as NumPy code point arrays so the per-character
+    # comparison runs in a vectorized C loop. Pure ASCII strings map to one
+    # byte per character; anything else is widened to UTF-32 so that each
+    # array element still corresponds to exactly one character.
+    if string_a.isascii() and string_b.isascii():
+        codes_a = np.frombuffer(string_a.encode('ascii'), dtype=np.uint8)
+        codes_b = np.frombuffer(string_b.encode('ascii'), dtype=np.uint8)
+    else:
+        codes_a = np.frombuffer(string_a.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+        codes_b = np.frombuffer(string_b.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+
+    # Count the positions where characters differ, using the compiled kernel
+    # for long inputs when Numba is available.
+    if njit is not None and codes_a.size >= _NJIT_MIN_LENGTH:
+        return int(_hamming_njit(codes_a, codes_b))
+    return int(np.count_nonzero(codes_a != codes_b))
+
+def calculate_hamming_distance_bytes(bytes_a: bytes, bytes_b: bytes) -> int:
+    """
+    Calculates the bitwise Hamming distance between two byte strings.
+
+    Unlike calculate_hamming_distance, which counts differing characters,
+    this treats the inputs as bit vectors and counts the differing bits.
+    Both inputs are packed into Python integers so the comparison reduces
+    to a single XOR followed by a population count.
+
+    Args:
+        bytes_a (bytes): First bit vector for comparison.
+        bytes_b (bytes): Second bit vector for comparison.
+
+    Returns:
+        int: The number of bit positions at which the inputs differ.
+
+    Raises:
+        ValueError: If the inputs are not of equal length.
+    """
+    # A bitwise Hamming distance is only defined for vectors of equal length.
+    if len(bytes_a) != len(bytes_b):
+        raise ValueError("For Hamming distance, both inputs must be of the same length.")
+
+    # XOR leaves a 1 bit wherever the inputs differ; count those bits.
+    difference = int.from_bytes(bytes_a, 'little') ^ int.from_bytes(bytes_b, 'little')
+    return difference.bit_count()
@@ -1,5 +1,7 @@
 from similarity_coefficient import SimilarityCoefficient
-from typing import Set, Any
+from typing import Set, Any, Union
+
+import numpy as np
 
 class JaccardCoefficient(SimilarityCoefficient):
     """
@@ -9,7 +11,9 @@ class JaccardCoefficient(SimilarityCoefficient):
     to the union size of the two sets.
     """
 
-    def calculate(self, set_a: Set[Any], set_b: Set[Any]) -> float:
+    __slots__ = ()
+
+    def calculate(self, set_a: Union[Set[Any], int], set_b: Union[Set[Any], int]) -> float:
         """
         Calculates the Jaccard Coefficient between two sets.
 
@@ -17,14 +21,21 @@ class JaccardCoefficient(SimilarityCoefficient):
         division by zero if the union is empty.
 
         Args:
-            set_a (Set[Any]): First set for comparison.
-            set_b (Set[Any]): Second set for comparison.
+            set_a (Set[Any] | int): First set, or character bitmask, for comparison.
+            set_b (Set[Any] | int): Second set, or character bitmask, for comparison.
 
         Returns:
             float: The calculated Jaccard Coefficient.
         """
-        intersection_size = len(set_a.intersection(set_b))
-        union_size = len(set_a.union(set_b))
+        # Character bitmasks are combined bitwise and sized by a popcount.
+        if isinstance(set_a, int) and isinstance(set_b, int):
+            intersection_size = (set_a & set_b).bit_count()
+            union_size = (set_a | set_b).bit_count()
+        else:
+            # |X∪Y| = |X| + |Y| - |X∩Y|, so only the intersection is built.
+            # set.intersection already iterates over the smaller set.
+            intersection_size = len(set_a.intersection(set_b))
+            union_size = len(set_a) + len(set_b) - intersection_size
 
         # Handle the edge case where the union of sets is empty.
         if union_size == 0:
@@ -32,6 +43,26 @@ class JaccardCoefficient(SimilarityCoefficient):
 
         return intersection_size / union_size
 
+    @classmethod
+    def _scores_from_counts(cls, intersection_sizes: np.ndarray, sizes_a: np.ndarray,
+                            sizes_b: np.ndarray) -> np.ndarray:
+        """
+        Converts per-pair set sizes into Jaccard Coefficients for calculate_batch.
+
+        Args:
+            intersection_sizes (np.ndarray): |A∩B| for each pair.
+            sizes_a (np.ndarray): |A| for each pair.
+            sizes_b (np.ndarray): |B| for each pair.
+
+        Returns:
+            np.ndarray: The Jaccard Coefficient for each pair.
+        """
+        union_sizes = sizes_a + sizes_b - intersection_sizes
+
+        # Pairs with an empty union score 0.0, as in calculate().
+        return np.divide(intersection_sizes, union_sizes, out=np.zeros(len(union_sizes)),
+                         where=union_sizes != 0)
+
 def calculate_string_jaccard(string_a: str, string_b: str) -> float:
     """
     A helper function to calculate the Jaccard Coefficient between two strings.
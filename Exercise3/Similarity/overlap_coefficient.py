@@ -1,5 +1,7 @@
 from similarity_coefficient import SimilarityCoefficient
-from typing import Set, Any
+from typing import Set, Any, Union
+
+import numpy as np
 
 class OverlapCoefficient(SimilarityCoefficient):
     """
@@ -10,7 +12,9 @@ class OverlapCoefficient(SimilarityCoefficient):
     to the size of the smaller of the two sets.
     """
 
-    def calculate(self, set_a: Set[Any], set_b: Set[Any]) -> float:
+    __slots__ = ()
+
+    def calculate(self, set_a: Union[Set[Any], int], set_b: Union[Set[Any], int]) -> float:
         """
         Calculates the Overlap Coefficient between two sets.
 
@@ -18,21 +22,51 @@ class OverlapCoefficient(SimilarityCoefficient):
         division by zero if the smaller set is empty.
 
         Args:
-            set_a (Set[Any]): First set for comparison.
-            set_b (Set[Any]): Second set for comparison.
+            set_a (Set[Any] | int): First set, or character bitmask, for comparison.
+            set_b (Set[Any] | int): Second set, or character bitmask, for comparison.
 
         Returns:
             float: The calculated Overlap Coefficient.
         """
-        intersection_size = len(set_a.intersection(set_b))
-        min_size = min(len(set_a), len(set_b))
+        # Character bitmasks are combined bitwise and sized by a popcount.
+        if isinstance(set_a, int) and isinstance(set_b, int):
+            min_size = min(set_a.bit_count(), set_b.bit_count())
+        else:
+            min_size = min(len(set_a), len(set_b))
 
         # Handle the edge case where the smaller set is empty.
+        # This is checked before the intersection is built, so it is skipped
+        # entirely when there is nothing to compare.
         if min_size == 0:
             return 0.0
 
+        if isinstance(set_a, int) and isinstance(set_b, int):
+            intersection_size = (set_a & set_b).bit_count()
+        else:
+            intersection_size = len(set_a.intersection(set_b))
+
         return intersection_size / min_size
 
+    @classmethod
+    def _scores_from_counts(cls, intersection_sizes: np.ndarray, sizes_a: np.ndarray,
+                            sizes_b: np.ndarray) -> np.ndarray:
+        """
+        Converts per-pair set sizes into Overlap Coefficients for calculate_batch.
+
+        Args:
+            intersection_sizes (np.ndarray): |A∩B| for each pair.
+            sizes_a (np.ndarray): |A| for each pair.
+            sizes_b (np.ndarray): |B| for each pair.
+
+        Returns:
+            np.ndarray: The Overlap Coefficient for each pair.
+        """
+        min_sizes = np.minimum(sizes_a, sizes_b)
+
+        # Pairs where the smaller set is empty score 0.0, as in calculate().
+        return np.divide(intersection_sizes, min_sizes, out=np.zeros(len(min_sizes)),
+                         where=min_sizes != 0)
+
 def calculate_string_overlap(string_a: str, string_b: str) -> float:
     """
     A helper function to calculate the Overlap Coefficient between two strings.
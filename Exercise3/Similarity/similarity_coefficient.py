@@ -1,14 +1,19 @@
 from abc import ABC, abstractmethod
-from typing import Set, Any
+from typing import Set, Any, Sequence, Tuple
+
+import numpy as np
 
 class SimilarityCoefficient(ABC):
     """
     An abstract base class for implementing various similarity coefficient algorithms.
 
     This class defines the standard interface for calculating a similarity score
-    between two sets. Subclasses are required to implement the 'calculate' method.
+    between two sets. Subclasses are required to implement the 'calculate' and
+    '_scores_from_counts' methods.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def calculate(self, set_a: Set[Any], set_b: Set[Any]) -> float:
         """
@@ -24,4 +29,158 @@ class SimilarityCoefficient(ABC):
         Returns:
             float: The calculated similarity score, typically ranging from 0.0 to 1.0.
         """
-        pass
\ No newline at end of file
+        pass
+
+    @classmethod
+    def calculate_batch(cls, bits_a: np.ndarray, bits_b: np.ndarray) -> np.ndarray:
+        """
+        Calculates the similarity score for many pairs of pre-encoded sets at once.
+
+        The sets are given as rows of uint64 bitmask matrices, as built by
+        encode_bitsets. Intersection and set sizes for every pair are counted
+        with vectorized bitwise operations and population counts, and
+        converted to scores by _scores_from_counts.
+
+        Encoding is deliberately left to the caller, as it costs far more than
+        scoring. A batch only pays off when the matrices are encoded once and
+        scored repeatedly; for one-off pairs of sets, call calculate directly.
+
+        Args:
+            bits_a (np.ndarray): An (N, k) uint64 matrix holding the first set of each pair.
+            bits_b (np.ndarray): An (N, k) uint64 matrix holding the second set of each pair.
+
+        Returns:
+            np.ndarray: The score for each pair (bits_a[i], bits_b[i]).
+
+        Raises:
+            ValueError: If the matrices have different shapes.
+        """
+        if bits_a.shape != bits_b.shape:
+            raise ValueError("Both bitmask matrices must have the same shape.")
+
+        return cls._scores_from_counts(
+            _popcount_rows(bits_a & bits_b), _popcount_rows(bits_a), _popcount_rows(bits_b))
+
+    @classmethod
+    @abstractmethod
+    def _scores_from_counts(cls, intersection_sizes: np.ndarray, sizes_a: np.ndarray,
+                            sizes_b: np.ndarray) -> np.ndarray:
+        """
+        Converts per-pair set sizes into similarity scores for calculate_batch.
+
+        This method must be implemented by any subclass inheriting from
+        SimilarityCoefficient.
+
+        Args:
+            intersection_sizes (np.ndarray): |A∩B| for each pair.
+            sizes_a (np.ndarray): |A| for each pair.
+            sizes_b (np.ndarray): |B| for each pair.
+
+        Returns:
+            np.ndarray: The similarity score for each pair.
+        """
+        pass
+
+def encode_bitsets(sets_a: Sequence[Set[Any]], sets_b: Sequence[Set[Any]]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Encodes two sequences of sets as uint64 bitmask matrices for calculate_batch.
+
+    Every distinct element across both sequences is assigned a bit, and row i
+    of each matrix has the bits of the elements of the i-th set set.
+
+    Args:
+        sets_a (Sequence[Set[Any]]): The first sequence of sets.
+        sets_b (Sequence[Set[Any]]): The second sequence of sets.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The (N, k) bitmask matrices.
+
+    Raises:
+        ValueError: If the sequences contain a different number of sets.
+    """
+    if len(sets_a) != len(sets_b):
+        raise ValueError("Both sequences must contain the same number of sets.")
+
+    vocabulary = {}
+    bit_indices = []
+    for sets in (sets_a, sets_b):
+        bit_indices.append([
+            np.fromiter((vocabulary.setdefault(element, len(vocabulary)) for element in elements),
+                        dtype=np.int64, count=len(elements))
+            for elements in sets
+        ])
+
+    words = max(1, -(-len(vocabulary) // 64))
+    matrices = []
+    for indices in bit_indices:
+        matrix = np.zeros((len(indices), words), dtype=np.uint64)
+        if indices:
+            rows = np.repeat(np.arange(len(indices)), [len(bits) for bits in indices])
+            bits = np.concatenate(indices).astype(np.uint64)
+            np.bitwise_or.at(matrix, (rows, bits >> np.uint64(6)), np.uint64(1) << (bits & np.uint64(63)))
+        matrices.append(matrix)
+    return matrices[0], matrices[1]
+
+def _popcount_rows(bits: np.ndarray) -> np.ndarray:
+    """
+    Counts the set bits in each row of a uint64 bitmask matrix.
+
+    Args:
+        bits (np.ndarray): An (N, k) uint64 matrix.
+
+    Returns:
+        np.ndarray: The number of set bits in each of the N rows.
+    """
+    # NumPy 2.0 added a hardware popcount ufunc; older versions unpack the
+    # bytes into individual bits and sum them instead.
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(bits).sum(axis=1, dtype=np.int64)
+    return np.unpackbits(bits.view(np.uint8), axis=1).sum(axis=1, dtype=np.int64)
+
+# Bits set for 'A'-'Z' in a character bitmask, and the distance from each
+# uppercase letter to its lowercase form.
+_ASCII_UPPERCASE_BITS = ((1 << 26) - 1) << ord('A')
+_ASCII_CASE_OFFSET = ord('a') - ord('A')
+
+def ascii_character_mask(string: str) -> int:
+    """
+    Builds a bitmask of the unique, lowercase characters in a string.
+
+    Bit n of the result is set when the character with code n appears in the
+    lowercased string, so the character set of an ASCII string fits in a
+    single 128-bit integer. Set operations then become bitwise operations,
+    and set sizes become population counts.
+
+    For ASCII strings, lowercasing is folded into the mask rather than
+    applied to the string: the mask is built from the original characters,
+    and the bits for 'A'-'Z' are then moved onto 'a'-'z'. No lowercase copy
+    of the string is made. Other strings are lowercased with str.lower(),
+    and their masks extend past bit 127 as far as their code points need.
+
+    Building a mask costs more than set(string.lower()), but two masks are
+    scored faster than two sets. Masks therefore only pay off when they are
+    built once and compared many times; the string helpers keep the set path.
+
+    Args:
+        string (str): The string.
+
+    Returns:
+        int: The character bitmask of the string.
+    """
+    # Deduplicate the characters in C first so that the Python loop only
+    # visits each unique character once.
+    mask = 0
+    if not string.isascii():
+        for character in set(string.lower()):
+            mask |= 1 << ord(character)
+        return mask
+
+    for code in set(string.encode('ascii')):
+        mask |= 1 << code
+
+    # Move any uppercase bits onto their lowercase counterparts.
+    uppercase = mask & _ASCII_UPPERCASE_BITS
+    if uppercase:
+        mask ^= uppercase
+        mask |= uppercase << _ASCII_CASE_OFFSET
+    return mask
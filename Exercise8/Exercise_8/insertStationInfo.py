@@ -1,10 +1,387 @@
 import csv
+import itertools
 import os
+import re
 import sqlite3
 import sys
+import threading
 import time
+import numpy as np
+import pandas as pd
 import psutil
 
+try:
+    import resource
+except ImportError:  # resource is POSIX only; fall back to psutil's RSS.
+    resource = None
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; fall back to the regular expression.
+    njit = None
+
+try:
+    import apsw
+except ImportError:  # APSW is optional; fall back to the standard sqlite3 module.
+    apsw = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # PyArrow is optional; fall back to pandas' C parser.
+    pa = None
+
+# Matches the coordinate pair in a 'Point(lon lat)' string. The pattern is
+# compiled once here rather than re-parsing the string on every row.
+_POINT_RE = re.compile(r'Point\(\s*([^\s)]+)\s+([^\s)]+)')
+
+# ru_maxrss is reported in kilobytes on Linux but in bytes on macOS.
+_MAXRSS_UNIT = 1 if sys.platform == 'darwin' else 1024
+
+def _peak_rss_bytes(process):
+    """
+    Returns the peak Resident Set Size (RSS) of the process so far.
+
+    getrusage() is a single system call, so this is cheap enough to call
+    around every run. Without the resource module, the current RSS reported
+    by psutil is used instead.
+
+    :param process: The process to measure, used without resource.
+    :type process: psutil.Process
+    :return: The RSS in bytes.
+    :rtype: int
+    """
+    if resource is not None:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _MAXRSS_UNIT
+    return process.memory_info().rss
+
+# The number of CSV rows read and written to the database at a time.
+_BATCH_SIZE = 10_000
+
+# The number of bytes of CSV PyArrow reads at a time, which sets its batch size.
+_ARROW_BLOCK_SIZE = 1 << 20
+
+# The columns of 'station_info' in insertion order.
+_COLUMNS = ('station_id', 'name', 'short_name', 'lat', 'lon', 'capacity',
+            'system_id', 'timezone', 'rental_methods')
+
+# The number of rows written by one multi-row INSERT. 64 rows of 9 columns
+# stay well below SQLite's default limit of 999 bound parameters.
+_ROWS_PER_INSERT = 64
+
+def _insert_sql(rows):
+    """
+    Builds an INSERT statement that writes several rows at once.
+
+    Use 'INSERT OR IGNORE' to skip rows with duplicate station_id.
+
+    :param rows: The number of rows the statement inserts.
+    :type rows: int
+    :return: The SQL of the statement.
+    :rtype: str
+    """
+    values = '(' + ', '.join('?' * len(_COLUMNS)) + ')'
+    return (f"INSERT OR IGNORE INTO station_info ({', '.join(_COLUMNS)}) "
+            f"VALUES {', '.join([values] * rows)}")
+
+# The statements for every block size, built once and indexed by the number
+# of rows they insert. Each is a fixed string, so the connection's statement
+# cache finds its prepared statement again on every chunk.
+_INSERT_SQL = tuple(_insert_sql(rows) for rows in range(_ROWS_PER_INSERT + 1))
+
+def _prefetch_file(path):
+    """
+    Asks the kernel to start reading a file into the page cache.
+
+    The readahead runs in the background while the first chunks are being
+    parsed, so that reading later chunks does not wait on the disk. Only
+    platforms with posix_fadvise() do anything.
+
+    :param path: The path of the file.
+    :type path: str
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass  # Advice only; the file is read normally either way.
+    finally:
+        os.close(fd)
+
+def _text_column(chunk, name):
+    """
+    Returns a text column of a raw CSV chunk, ready for binding to SQLite.
+
+    Missing values, and columns absent from the CSV, become None.
+
+    :param chunk: The raw CSV fields.
+    :type chunk: pandas.DataFrame
+    :param name: The name of the column.
+    :type name: str
+    :return: The column as a list of Python strings and None.
+    :rtype: list
+    """
+    if name not in chunk:
+        return [None] * len(chunk)
+    column = chunk[name]
+    if column.hasnans:
+        column = column.astype(object).where(column.notna(), None)
+    return column.tolist()
+
+# Loading the compiled coordinate parser costs a fixed ~0.15 s per process,
+# which only pays off on large files, so it is used once this many rows have
+# been read.
+_NJIT_MIN_ROWS = 100_000
+
+if njit is not None:
+    # Exact powers of ten as floats; 10**22 is the largest that a float holds
+    # exactly.
+    _POWERS_OF_TEN = np.array([10.0 ** k for k in range(23)])
+
+    @njit(cache=True)
+    def _parse_number_njit(data, start, end):
+        """
+        Parses a plain decimal number such as '-141.35' from ASCII bytes.
+
+        Only numbers with at most 15 digits are accepted, so that the digits
+        fit a float exactly and a single division by a power of ten rounds
+        correctly, giving the same result as float().
+
+        :param data: The bytes holding the number.
+        :param start: The index of the first byte of the number.
+        :param end: The index one past the last byte of the number.
+        :return: The number, and whether the bytes could be parsed.
+        """
+        negative = False
+        if start < end and (data[start] == 43 or data[start] == 45):  # '+' or '-'
+            negative = data[start] == 45
+            start += 1
+        mantissa = 0
+        digits = 0
+        decimals = 0
+        point = False
+        for i in range(start, end):
+            c = data[i]
+            if 48 <= c <= 57:  # '0' to '9'
+                mantissa = mantissa * 10 + (c - 48)
+                digits += 1
+                if point:
+                    decimals += 1
+            elif c == 46 and not point:  # '.'
+                point = True
+            else:
+                return 0.0, False
+        if digits == 0 or digits > 15:
+            return 0.0, False
+        value = mantissa / _POWERS_OF_TEN[decimals]
+        return (-value if negative else value), True
+
+    @njit(cache=True)
+    def _is_space_njit(c):
+        """
+        Returns whether an ASCII byte is whitespace, as matched by _POINT_RE.
+        """
+        return c == 32 or 9 <= c <= 13 or 28 <= c <= 31
+
+    @njit(cache=True)
+    def _parse_points_njit(data, offsets):
+        """
+        Parses 'Point(lon lat)' strings packed into one ASCII buffer.
+
+        Empty strings are left at 0.0. Strings that are not a 'Point(' with
+        two plain decimal numbers are marked as not parsed, to be handled by
+        the regular expression instead.
+
+        :param data: The strings, concatenated as ASCII bytes.
+        :param offsets: The index in data where each string starts, followed
+            by the length of data.
+        :return: The longitudes, the latitudes, and whether each string was
+            handled.
+        """
+        n = len(offsets) - 1
+        lon = np.zeros(n)
+        lat = np.zeros(n)
+        parsed = np.zeros(n, np.bool_)
+        for row in range(n):
+            start = offsets[row]
+            end = offsets[row + 1]
+            if start == end:
+                parsed[row] = True
+                continue
+
+            # Find the first 'Point('.
+            i = start
+            while i + 6 <= end and not (data[i] == 80 and data[i + 1] == 111 and data[i + 2] == 105
+                                        and data[i + 3] == 110 and data[i + 4] == 116 and data[i + 5] == 40):
+                i += 1
+            if i + 6 > end:
+                continue
+            i += 6
+
+            # The longitude, the whitespace that separates it from the
+            # latitude, and the latitude.
+            while i < end and _is_space_njit(data[i]):
+                i += 1
+            lon_start = i
+            while i < end and data[i] != 41 and not _is_space_njit(data[i]):  # ')'
+                i += 1
+            lon_end = i
+            if lon_start == lon_end or i == end or not _is_space_njit(data[i]):
+                continue
+            while i < end and _is_space_njit(data[i]):
+                i += 1
+            lat_start = i
+            while i < end and data[i] != 41 and not _is_space_njit(data[i]):
+                i += 1
+            if lat_start == i:
+                continue
+
+            lon_value, lon_ok = _parse_number_njit(data, lon_start, lon_end)
+            lat_value, lat_ok = _parse_number_njit(data, lat_start, i)
+            if lon_ok and lat_ok:
+                lon[row] = lon_value
+                lat[row] = lat_value
+                parsed[row] = True
+        return lon, lat, parsed
+
+def _capacity_column(chunk):
+    """
+    Returns the capacity column of a raw CSV chunk as integers.
+
+    Capacities that are missing or not a number become 0. Plain integers,
+    the usual case, are converted by NumPy in one call; only when some value
+    is not one does the chunk go through the more lenient conversion.
+
+    :param chunk: The raw CSV fields.
+    :type chunk: pandas.DataFrame
+    :return: The column as a list of Python ints.
+    :rtype: list
+    """
+    if 'capacity' not in chunk:
+        return [0] * len(chunk)
+    raw_capacity = chunk['capacity']
+    try:
+        return np.array(raw_capacity.tolist(), dtype=np.int64).tolist()
+    except (TypeError, ValueError, OverflowError):
+        pass
+
+    parsed_capacity = pd.to_numeric(raw_capacity, errors='coerce')
+    # NaN and infinities fail this comparison as well.
+    valid = parsed_capacity.abs() < 2**63
+    capacity = parsed_capacity.where(valid, 0).astype('int64')
+
+    # Retry what the vectorized parser rejected with float(), which
+    # also accepts forms such as '1_000' and surrounding whitespace.
+    retry = ~valid & raw_capacity.notna() & (raw_capacity != '')
+    for label in chunk.index[retry]:
+        try:
+            value = int(float(raw_capacity[label]))
+        except (TypeError, ValueError, OverflowError):
+            continue
+        if -2**63 <= value < 2**63:
+            capacity[label] = value
+    return capacity.tolist()
+
+class _APSWConnection:
+    """
+    Gives an APSW connection the parts of the sqlite3 interface this module
+    uses.
+
+    APSW binds parameters and steps statements with less work per row than
+    the standard sqlite3 module, and never opens transactions implicitly.
+    """
+
+    __slots__ = ('_conn',)
+
+    def __init__(self, db_name):
+        """
+        Opens the database.
+
+        :param db_name: The name of the SQLite database file, or ':memory:'.
+        :type db_name: str
+        """
+        self._conn = apsw.Connection(db_name, statementcachesize=256)
+
+    def cursor(self):
+        """
+        Returns a new cursor, which offers execute() and executemany().
+        """
+        return self._conn.cursor()
+
+    def execute(self, sql, params=None):
+        """
+        Executes a statement on a new cursor and returns the cursor.
+        """
+        return self._conn.execute(sql, params)
+
+    def executescript(self, sql):
+        """
+        Executes several statements, discarding any rows they return.
+
+        APSW only runs each statement after the first once the rows of the
+        ones before it have been read, so all of them are read here.
+
+        :param sql: The statements, separated by semicolons.
+        :type sql: str
+        """
+        for _ in self._conn.execute(sql):
+            pass
+
+    def backup(self, target):
+        """
+        Copies the whole database over the database of another connection.
+
+        :param target: The connection to copy to.
+        :type target: _APSWConnection
+        """
+        with target._conn.backup('main', self._conn, 'main') as backup:
+            backup.step()
+
+    @property
+    def total_changes(self):
+        """
+        The number of rows changed since the connection was opened.
+        """
+        return self._conn.total_changes()
+
+    @property
+    def in_transaction(self):
+        """
+        Whether a transaction is open.
+        """
+        return self._conn.in_transaction
+
+    def close(self):
+        """
+        Closes the connection.
+        """
+        self._conn.close()
+
+if apsw is not None:
+    _DatabaseError = apsw.Error
+else:
+    _DatabaseError = sqlite3.Error
+
+def _connect(db_name):
+    """
+    Opens a database with APSW when it is installed, and sqlite3 otherwise.
+
+    With sqlite3, isolation_level=None stops the driver from opening and
+    committing transactions implicitly; run() issues BEGIN and COMMIT
+    itself. Either statement cache holds all of _INSERT_SQL with room to
+    spare.
+
+    :param db_name: The name of the SQLite database file, or ':memory:'.
+    :type db_name: str
+    :return: The connection.
+    :rtype: sqlite3.Connection or _APSWConnection
+    """
+    if apsw is not None:
+        return _APSWConnection(db_name)
+    return sqlite3.connect(db_name, isolation_level=None, cached_statements=256)
+
 class insertStationInfo:
     """
     Manages the process of reading a CSV file and populating a database.
@@ -14,7 +391,10 @@ class insertStationInfo:
     and processing metrics.
     """
 
-    def __init__(self, file_path, db_name="station_data.db"):
+    __slots__ = ('file_path', 'db_name', 'safe', 'in_memory', 'conn', '_disk_conn', 'process', '_rows_in_csv', '_rows_inserted',
+                 '_runtime', '_memory_rss_bytes', '_memory_uss_bytes')
+
+    def __init__(self, file_path, db_name="station_data.db", safe=True, in_memory=None):
         """
         Initializes the insertStationInfo object.
 
@@ -22,13 +402,25 @@ class insertStationInfo:
         :type file_path: str
         :param db_name: The name of the SQLite database file to use.
         :type db_name: str
+        :param safe: Whether the database must survive a crash during the load.
+            When False, journaling and syncing are switched off entirely,
+            which is only suitable for throwaway databases.
+        :type safe: bool
+        :param in_memory: Whether to load into an in-memory copy of the
+            database and write it to disk once at the end. The database must
+            then fit in memory. When None, this is on unless the environment
+            variable INSERT_MEM is set to '0'.
+        :type in_memory: bool or None
         """
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"The file '{file_path}' was not found.")
 
         self.file_path = file_path
         self.db_name = db_name
+        self.safe = safe
+        self.in_memory = os.environ.get('INSERT_MEM') != '0' if in_memory is None else in_memory
         self.conn = None
+        self._disk_conn = None
         self.process = psutil.Process(os.getpid())
 
         # Initialize metrics
@@ -36,22 +428,55 @@ class insertStationInfo:
         self._rows_inserted = 0
         self._runtime = 0.0
         self._memory_rss_bytes = 0
-        self._memory_uss_bytes = 0
+        self._memory_uss_bytes = None
 
     def _connect_db(self):
         """
         Establishes a connection to the SQLite database and creates the
         'station_info' table if it doesn't already exist.
+
+        With in_memory, self.conn is an in-memory copy of the database and
+        self._disk_conn the connection to the file.
         """
         try:
-            self.conn = sqlite3.connect(self.db_name)
+            self.conn = _connect(self.db_name)
+            # Tune the connection for bulk loading: use 8 KiB pages, so that
+            # a load touches half as many pages (this only takes effect on a
+            # new database, before its first page is written), hold the
+            # database lock for the whole load, keep temporary data and a
+            # 512 MiB page cache in memory, memory-map the database file, and
+            # truncate a journal left larger than 64 MiB.
+            self.conn.executescript('''
+                PRAGMA page_size=8192;
+                PRAGMA locking_mode=EXCLUSIVE;
+                PRAGMA temp_store=MEMORY;
+                PRAGMA cache_size=-524288;
+                PRAGMA mmap_size=268435456;
+                PRAGMA journal_size_limit=67108864;
+            ''')
+            if self.safe:
+                # WAL with synchronous=NORMAL only syncs at checkpoints, yet
+                # the database stays consistent if the process crashes.
+                self.conn.executescript('''
+                    PRAGMA journal_mode=WAL;
+                    PRAGMA synchronous=NORMAL;
+                ''')
+            else:
+                # No journal and no syncing: fastest, but a crash mid-load can
+                # corrupt the database file.
+                self.conn.executescript('''
+                    PRAGMA journal_mode=OFF;
+                    PRAGMA synchronous=OFF;
+                ''')
             cursor = self.conn.cursor()
             # Create table with a schema that matches stationInfo.csv
             # Using 'IF NOT EXISTS' prevents errors on subsequent runs.
-            # Using 'station_id' as PRIMARY KEY to prevent duplicates.
+            # Duplicate station_ids are prevented by the unique index
+            # idx_station_id rather than a PRIMARY KEY, so that the index can
+            # be built after a bulk load instead of updated on every insert.
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS station_info (
-                    station_id TEXT PRIMARY KEY,
+                    station_id TEXT,
                     name TEXT,
                     short_name TEXT,
                     lat REAL,
@@ -62,11 +487,314 @@ class insertStationInfo:
                     rental_methods TEXT
                 )
             ''')
-            self.conn.commit()
-        except sqlite3.Error as e:
+
+            if self.in_memory:
+                # Load into a copy of the database held in memory, so that
+                # inserts and index builds never touch the disk. run() copies
+                # it back with one backup at the end.
+                self._disk_conn = self.conn
+                self.conn = _connect(':memory:')
+                self.conn.execute('PRAGMA temp_store=MEMORY')
+                self._disk_conn.backup(self.conn)
+        except _DatabaseError as e:
             print(f"Database error: {e}")
             sys.exit(1)
 
+    def _read_chunks(self):
+        """
+        Reads the CSV file in chunks of up to _BATCH_SIZE rows.
+
+        Every field is read as a string, with empty fields kept as empty
+        strings. Blank lines are skipped, rows with fewer fields than the
+        header are kept with the missing fields empty, and rows with more
+        fields are kept without their extra fields. When PyArrow is
+        installed, its multithreaded CSV reader is used instead of pandas'
+        parser. Either way the file is memory-mapped rather than read through
+        a buffered stream, and the kernel is asked to read it ahead of the
+        parser.
+
+        :return: A generator of DataFrames holding the raw CSV fields,
+            indexed by data row number.
+        :rtype: generator
+        """
+        _prefetch_file(self.file_path)
+        if pa is not None:
+            yield from self._read_chunks_arrow()
+        else:
+            yield from self._read_chunks_pandas()
+
+    def _read_chunks_pandas(self, skip=0):
+        """
+        Reads the CSV file in chunks of up to _BATCH_SIZE rows with pandas.
+
+        Rows with fewer fields than the header are kept, with their missing
+        fields read as empty strings. Rows with more fields are kept without
+        their extra fields, as csv.DictReader kept them. pandas' C parser
+        cannot cut a row short, so it reads the file up to the chunk with the
+        first such row, and the slower Python parser reads the rest.
+
+        :param skip: The number of data rows at the start of the file to
+            leave out, because they were already read.
+        :type skip: int
+        :return: A generator of DataFrames holding the raw CSV fields,
+            indexed by data row number.
+        :rtype: generator
+        """
+        # An empty file has no header and no rows, and cannot be mapped.
+        if os.path.getsize(self.file_path) == 0:
+            return
+
+        # index_col=False stops pandas from taking the first column as the
+        # index when the first row has one field more than the header, which
+        # would shift every column left. Its extra field is dropped instead.
+        options = dict(dtype=str, keep_default_na=False, encoding='utf-8-sig',
+                       chunksize=_BATCH_SIZE, memory_map=True, index_col=False)
+        try:
+            chunks = pd.read_csv(self.file_path, engine='c', on_bad_lines='error', **options)
+        except pd.errors.EmptyDataError:
+            # Nor does a file of blank lines.
+            return
+
+        # The number of data rows read from the file so far.
+        rows_read = 0
+        try:
+            with chunks:
+                for chunk in chunks:
+                    rows_read += len(chunk)
+                    if skip >= len(chunk):
+                        skip -= len(chunk)
+                        continue
+                    if skip:
+                        chunk = chunk.iloc[skip:]
+                        skip = 0
+                    yield chunk
+            return
+        except pd.errors.ParserError:
+            # The C parser stops at the first row that is too long. Every row
+            # before the chunks it failed in was already handled, and the
+            # Python parser carries on from there.
+            skip += rows_read
+
+        # With index_col=False, the Python parser keeps rows that are too
+        # long and drops their extra fields, with a ParserWarning. It reads
+        # the missing fields of short rows as NaN where the C parser reads
+        # empty strings, so those are filled in to match.
+        with pd.read_csv(self.file_path, engine='python', **options) as chunks:
+            for chunk in chunks:
+                if skip >= len(chunk):
+                    skip -= len(chunk)
+                    continue
+                if skip:
+                    chunk = chunk.iloc[skip:]
+                    skip = 0
+                yield chunk.fillna('')
+
+    def _read_chunks_arrow(self):
+        """
+        Reads the CSV file in blocks of _ARROW_BLOCK_SIZE bytes with PyArrow.
+
+        PyArrow can only skip a row whose number of fields does not match
+        the header, where pandas keeps it. So that the table does not depend
+        on which reader is installed, the first such row hands the rest of
+        the file over to _read_chunks_pandas().
+
+        :return: A generator of DataFrames holding the raw CSV fields,
+            indexed by data row number.
+        :rtype: generator
+        """
+        # PyArrow infers column types from the first block unless told
+        # otherwise, so read the header first and declare every column as
+        # a string.
+        with open(self.file_path, mode='r', encoding='utf-8-sig', newline='') as infile:
+            header = next(csv.reader(infile), None)
+        if not header:
+            return
+
+        uneven_rows = threading.Event()
+
+        def skip_invalid_row(row):
+            # Called from PyArrow's reader threads.
+            uneven_rows.set()
+            return 'skip'
+
+        # Parse straight from a memory map of the file, so that its blocks
+        # are not first copied into buffers of their own.
+        start = 0
+        with pa.memory_map(self.file_path) as source:
+            reader = pacsv.open_csv(
+                source,
+                read_options=pacsv.ReadOptions(block_size=_ARROW_BLOCK_SIZE),
+                parse_options=pacsv.ParseOptions(invalid_row_handler=skip_invalid_row),
+                convert_options=pacsv.ConvertOptions(column_types={name: pa.string() for name in header}),
+            )
+            for batch in reader:
+                # The reader may already be parsing blocks ahead of this
+                # batch, so once any row was skipped, this batch is not used
+                # either.
+                if uneven_rows.is_set():
+                    break
+                chunk = batch.to_pandas()
+                chunk.index = pd.RangeIndex(start, start + len(chunk))
+                start += len(chunk)
+                yield chunk
+
+        if uneven_rows.is_set():
+            yield from self._read_chunks_pandas(skip=start)
+
+    def _parse_chunk(self, chunk):
+        """
+        Converts a chunk of raw CSV fields into rows for 'station_info'.
+
+        Capacities are converted for the whole chunk at once, and only the
+        values that the vectorized parsers reject are retried one by one.
+        Coordinates are parsed from one column list rather than from whole
+        rows, by compiled code when Numba is installed and the file is large.
+
+        :param chunk: The raw CSV fields, indexed by data row number.
+        :type chunk: pandas.DataFrame
+        :return: One list per table column, in table order.
+        :rtype: tuple
+        """
+        self._rows_in_csv += len(chunk)
+
+        lon = [0.0] * len(chunk)
+        lat = [0.0] * len(chunk)
+
+        # The CSV contains coordinates in a single 'Point(lon lat)' string.
+        # Find the column holding it, checking common column names where
+        # this data might be.
+        point_key = next((key for key in ('lat', 'location', 'point', 'the_geom') if key in chunk), None)
+        if point_key is not None:
+            points = chunk[point_key].fillna('').tolist()
+            rows = range(len(points))
+
+            # With Numba, scan the strings of large files as one block of
+            # bytes and parse the plain decimal coordinates there; only what
+            # it cannot handle goes through the regular expression below.
+            if njit is not None and points and self._rows_in_csv > _NJIT_MIN_ROWS:
+                text = ''.join(points)
+                data = text.encode('utf-8')
+                if len(data) == len(text):  # ASCII, so byte and str offsets agree
+                    offsets = np.zeros(len(points) + 1, np.int64)
+                    np.cumsum(np.fromiter(map(len, points), np.int64, len(points)), out=offsets[1:])
+                    lon_array, lat_array, parsed = _parse_points_njit(np.frombuffer(data, np.uint8), offsets)
+                    lon = lon_array.tolist()
+                    lat = lat_array.tolist()
+                    rows = np.flatnonzero(~parsed).tolist()
+
+            # Coordinates that cannot be parsed are left at 0.0 and reported
+            # together, with the first of them as an example, rather than
+            # with one message per row.
+            unparsed = 0
+            example = None
+            for i in rows:
+                point_str = points[i]
+                if point_str and (match := _POINT_RE.search(point_str)):
+                    try:
+                        # Extract numbers from 'Point(141.35 43.06)'
+                        lon[i] = float(match[1])
+                        lat[i] = float(match[2])
+                    except ValueError as parse_error:
+                        unparsed += 1
+                        example = example or f"row {chunk.index[i] + 2}: '{point_str}'. Error: {parse_error}"
+                elif point_str and 'Point' in point_str:
+                    unparsed += 1
+                    example = example or f"row {chunk.index[i] + 2}: '{point_str}'."
+            if unparsed:
+                print(f"Warning: Could not parse the coordinate strings of {unparsed} rows; the first is {example}")
+
+        return (
+            _text_column(chunk, 'station_id'), _text_column(chunk, 'name'),
+            _text_column(chunk, 'short_name'),
+            lat, lon, _capacity_column(chunk),
+            _text_column(chunk, 'system_id'), _text_column(chunk, 'timezone'),
+            _text_column(chunk, 'rental_methods')
+        )
+
+    def _has_station_id_key(self, cursor):
+        """
+        Returns whether station_id is already unique through an index other
+        than idx_station_id, such as the one behind the PRIMARY KEY of tables
+        created by earlier versions of this class.
+
+        :param cursor: The cursor to execute the statements on.
+        :type cursor: sqlite3.Cursor or apsw.Cursor
+        :return: Whether such an index exists.
+        :rtype: bool
+        """
+        # Each row of index_list is (seq, name, unique, origin, partial), and
+        # each row of index_info is (seqno, cid, name).
+        for _, name, unique, _, partial in cursor.execute('PRAGMA index_list(station_info)').fetchall():
+            if name == 'idx_station_id' or not unique or partial:
+                continue
+            columns = [row[2] for row in cursor.execute(f'PRAGMA index_info("{name}")').fetchall()]
+            if columns == ['station_id']:
+                return True
+        return False
+
+    def _index_station_ids(self, cursor):
+        """
+        Removes duplicate station_ids and creates the unique index on them.
+
+        Of each set of rows sharing a station_id, the first one inserted is
+        kept, as 'INSERT OR IGNORE' would have done. Rows without a
+        station_id are never duplicates of each other. Duplicates are
+        usually rare, so the table is only rewritten when a first scan finds
+        some. A failed CREATE UNIQUE INDEX is not relied on to find them: with
+        safe=False there is no journal to roll it back, and it would leave a
+        broken schema behind.
+
+        :param cursor: The cursor to execute the statements on.
+        :type cursor: sqlite3.Cursor or apsw.Cursor
+        :return: The number of duplicate rows deleted.
+        :rtype: int
+        """
+        has_duplicates = cursor.execute('''
+            SELECT EXISTS (
+                SELECT 1 FROM station_info
+                WHERE station_id IS NOT NULL
+                GROUP BY station_id HAVING COUNT(*) > 1
+            )
+        ''').fetchone()[0]
+
+        deleted = 0
+        if has_duplicates:
+            changes_before = self.conn.total_changes
+            cursor.execute('''
+                DELETE FROM station_info
+                WHERE station_id IS NOT NULL AND rowid NOT IN (
+                    SELECT MIN(rowid) FROM station_info
+                    WHERE station_id IS NOT NULL
+                    GROUP BY station_id
+                )
+            ''')
+            deleted = self.conn.total_changes - changes_before
+        cursor.execute('CREATE UNIQUE INDEX IF NOT EXISTS idx_station_id ON station_info (station_id)')
+        return deleted
+
+    def _insert_rows(self, cursor, columns):
+        """
+        Inserts a parsed chunk into 'station_info'.
+
+        The rows are flattened into a stream of parameters and written
+        _ROWS_PER_INSERT at a time, so that SQLite runs one statement per
+        block of rows rather than per row. Only one block of parameters is
+        held at a time; executemany() pulls the blocks as it goes. The
+        remaining rows are written by the statement for exactly that many.
+
+        :param cursor: The cursor to execute the statements on.
+        :type cursor: sqlite3.Cursor or apsw.Cursor
+        :param columns: One list per table column, in table order.
+        :type columns: tuple
+        """
+        params = itertools.chain.from_iterable(zip(*columns))
+        block = _ROWS_PER_INSERT * len(_COLUMNS)
+        blocks = len(columns[0]) // _ROWS_PER_INSERT
+        cursor.executemany(_INSERT_SQL[_ROWS_PER_INSERT], (list(itertools.islice(params, block)) for _ in range(blocks)))
+        rest = list(params)
+        if rest:
+            cursor.execute(_INSERT_SQL[len(rest) // len(_COLUMNS)], rest)
+
     def run(self):
         """
         Executes the main logic: reading the CSV and inserting into the DB.
@@ -75,77 +803,78 @@ class insertStationInfo:
         memory measurement, file reading, and database insertion.
         """
         start_time = time.perf_counter()
-        initial_mem_info = self.process.memory_info()
+        initial_rss = _peak_rss_bytes(self.process)
+        # _parse_chunk() counts the rows of this run from zero.
+        self._rows_in_csv = 0
 
         self._connect_db()
 
         try:
-            # Use a broader encoding in case of file variations
-            with open(self.file_path, mode='r', encoding='utf-8-sig') as infile:
-                reader = csv.DictReader(infile)
-                data = list(reader)
-                self._rows_in_csv = len(data)
-
-                cursor = self.conn.cursor()
-                for i, row in enumerate(data):
-                    try:
-                        lat = 0.0
-                        lon = 0.0
-
-                        # FIX: The CSV contains coordinates in a single 'Point(lon lat)' string.
-                        # This logic finds that string, parses it, and extracts lat/lon.
-                        # It checks common column names where this data might be.
-                        point_str = next((row.get(key) for key in ['lat', 'location', 'point', 'the_geom'] if row.get(key)), None)
-
-                        if point_str and 'Point' in point_str:
-                            try:
-                                # Extract numbers from 'Point(141.35 43.06)'
-                                clean_str = point_str.strip().replace('Point(', '').replace(')', '')
-                                coords = clean_str.split()
-                                if len(coords) >= 2:
-                                    lon = float(coords[0])
-                                    lat = float(coords[1])
-                            except (ValueError, IndexError) as parse_error:
-                                print(f"Warning: Row {i + 2}: Could not parse coordinate string '{point_str}'. Error: {parse_error}")
-                        
-                        # Safely get and convert capacity
-                        cap_val = row.get('capacity')
-                        capacity = int(float(cap_val)) if cap_val and cap_val.replace('.', '', 1).isdigit() else 0
-
-                        # Use 'INSERT OR IGNORE' to skip rows with duplicate station_id
-                        cursor.execute('''
-                            INSERT OR IGNORE INTO station_info (
-                                station_id, name, short_name, lat, lon, capacity,
-                                system_id, timezone, rental_methods
-                            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        ''', (
-                            row.get('station_id'), row.get('name'), row.get('short_name'),
-                            lat, lon, capacity,
-                            row.get('system_id'), row.get('timezone'),
-                            row.get('rental_methods')
-                        ))
-                        self._rows_inserted += cursor.rowcount
-                    except Exception as e:
-                        # Catch any other unexpected errors in a row
-                        print(f"Skipping malformed row {i + 2} due to unexpected error: {e}")
-
-            self.conn.commit()
+            # Stream the CSV in chunks so that the whole file is never held
+            # in memory at once. Each chunk is parsed column by column and
+            # written with multi-row INSERTs in its own transaction, taking
+            # the write lock up front with BEGIN IMMEDIATE.
+            #
+            # Loading into an empty table, the unique index on station_id is
+            # dropped and built once the load is done, with the duplicates
+            # removed first; building an index from all rows at once is far
+            # cheaper than a B-tree lookup and update per insert. A table
+            # that already holds rows keeps its index, so that the rows
+            # already stored are not scanned for duplicates again.
+            cursor = self.conn.cursor()
+            cursor.execute('BEGIN IMMEDIATE')
+            # Tables created with station_id as PRIMARY KEY already keep it
+            # unique with an index that cannot be dropped, so they get no
+            # idx_station_id, and one left there by an earlier run is removed.
+            keyed = self._has_station_id_key(cursor)
+            deferred_index = not keyed and cursor.execute('SELECT NOT EXISTS (SELECT 1 FROM station_info)').fetchone()[0]
+            if keyed or deferred_index:
+                cursor.execute('DROP INDEX IF EXISTS idx_station_id')
+            elif not cursor.execute(
+                    "SELECT EXISTS (SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_station_id')"
+            ).fetchone()[0]:
+                # A load interrupted before its index was built leaves
+                # duplicates behind, which must go before the index is made.
+                self._index_station_ids(cursor)
+            cursor.execute('COMMIT')
+
+            changes_before = self.conn.total_changes
+            for chunk in self._read_chunks():
+                columns = self._parse_chunk(chunk)
+                cursor.execute('BEGIN IMMEDIATE')
+                self._insert_rows(cursor, columns)
+                cursor.execute('COMMIT')
+            self._rows_inserted = self.conn.total_changes - changes_before
+
+            if deferred_index:
+                cursor.execute('BEGIN IMMEDIATE')
+                self._rows_inserted -= self._index_station_ids(cursor)
+                cursor.execute('COMMIT')
 
         except IOError as e:
             print(f"Error reading file {self.file_path}: {e}")
         finally:
             if self.conn:
+                # Write the in-memory database back to disk, including the
+                # chunks loaded before any error, as they would have been
+                # committed to disk without it. The chunk that was being
+                # written when the error struck is rolled back first.
+                if self._disk_conn:
+                    if self.conn.in_transaction:
+                        self.conn.execute('ROLLBACK')
+                    self.conn.backup(self._disk_conn)
                 self.conn.close()
+            if self._disk_conn:
+                self._disk_conn.close()
+                self._disk_conn = None
 
         end_time = time.perf_counter()
-        final_mem_info = self.process.memory_info()
+        final_rss = _peak_rss_bytes(self.process)
 
         self._runtime = end_time - start_time
-        self._memory_rss_bytes = final_mem_info.rss - initial_mem_info.rss
-        if hasattr(final_mem_info, 'uss'):
-            self._memory_uss_bytes = final_mem_info.uss - initial_mem_info.uss
-        else:
-            self._memory_uss_bytes = None
+        self._memory_rss_bytes = final_rss - initial_rss
+        # USS is only measured when getMemoryUSS() asks for it.
+        self._memory_uss_bytes = None
 
     def getRows(self):
         """
@@ -167,18 +896,26 @@ class insertStationInfo:
 
     def getMemoryUSS(self):
         """
-        Returns the Unique Set Size (USS) memory consumed by the run.
+        Returns the Unique Set Size (USS) memory of the process after the run.
+
+        Measuring USS walks every memory mapping of the process, so it is
+        only done the first time this is called rather than on every run.
 
-        :return: The consumed USS memory as a formatted string or 'N/A'.
+        :return: The USS memory as a formatted string or 'N/A'.
         :rtype: str
         """
         if self._memory_uss_bytes is None:
-            return "N/A"
+            try:
+                self._memory_uss_bytes = self.process.memory_full_info().uss
+            except (AttributeError, psutil.Error):
+                # Not every platform reports USS, and reading it may need
+                # privileges the process does not have.
+                return "N/A"
         return f"{self._memory_uss_bytes / 1024**2:.2f} MB"
 
     def getMemoryRSS(self):
         """
-        Returns the Resident Set Size (RSS) memory consumed by the run.
+        Returns the growth of the peak Resident Set Size (RSS) during the run.
 
         :return: The consumed RSS memory as a formatted string.
         :rtype: str
@@ -214,7 +951,7 @@ if __name__ == "__main__":
         print(f"Rows inserted into DB: {obj.getRowsInserted()}")
         print(f"Total runtime:         {obj.getRuntime()}")
         print(f"Memory RSS consumed:   {obj.getMemoryRSS()}")
-        print(f"Memory USS consumed:   {obj.getMemoryUSS()}")
+        print(f"Memory USS after run:  {obj.getMemoryUSS()}")
         print("-------------------------\n")
 
     except FileNotFoundError as e:
@@ -1,51 +1,103 @@
+import sys
 from tHanoiAbstract import tHanoiAbstract
 
+# The number of buffered move statements at which they are written out.
+_FLUSH_THRESHOLD = 1 << 16
+
 class Hannoi(tHanoiAbstract):
     """
     A concrete implementation of the Tower of Hanoi solver.
-    This class inherits from tHanoiAbstract and implements the recursive
+    This class inherits from tHanoiAbstract and implements an iterative
     algorithm to solve the puzzle.
     """
 
+    __slots__ = ('_buf', '_buffering', '_messages')
+
+    def __init__(self):
+        """
+        Initializes the solver with an empty buffer of move statements and
+        an empty table of precomputed statements.
+        """
+        self._buf = []
+        self._buffering = False
+        self._messages = {}
+
     def move_disk(self, source, target):
         """
         Prints a statement to track the movement of a disk from a source rod
         to a target rod. This fulfills the move_disk abstract method.
 
+        While solve() is running, statements are buffered instead and written
+        to standard output by flush() once all moves are made, so that
+        printing does not cost one write per move.
+
         :param source: The name of the source rod (e.g., 'Rod A').
         :param target: The name of the target rod (e.g., 'Rod C').
         """
-        print(f"Move disk from {source} to {target}")
+        # Reuse the statement precomputed by solve() when there is one.
+        message = self._messages.get((source, target))
+        if message is None:
+            message = f"Move disk from {source} to {target}"
+        if not self._buffering:
+            print(message)
+            return
+        self._buf.append(message)
+        # Bound the buffer's memory for large numbers of disks.
+        if len(self._buf) >= _FLUSH_THRESHOLD:
+            self.flush()
+
+    def flush(self):
+        """
+        Writes all buffered move statements to standard output in one call.
+        """
+        if self._buf:
+            self._buf.append('')
+            sys.stdout.write('\n'.join(self._buf))
+            self._buf.clear()
 
     def solve(self, disks, source, auxiliary, target):
         """
-        Solves the Tower of Hanoi problem using a classic recursive algorithm.
+        Solves the Tower of Hanoi problem iteratively.
         This fulfills the solve abstract method.
 
-        The logic is as follows:
-        1. Move n-1 disks from the source to the auxiliary rod.
-        2. Move the nth (largest) disk from the source to the target rod.
-        3. Move the n-1 disks from the auxiliary rod to the target rod.
+        The moves are the same as those of the classic recursive algorithm,
+        but they are generated from a binary counter instead of recursion:
+        1. Number the moves 1 to 2^n - 1.
+        2. With the rods numbered 0 to 2, move m goes from rod
+           (m & (m - 1)) % 3 to rod ((m | (m - 1)) + 1) % 3.
+        3. The auxiliary and target rods swap numbers when the number of
+           disks is even, so that the tower always ends on the target rod.
+
+        This avoids one Python call frame per move, and the stack depth stays
+        constant however many disks there are.
 
         :param disks: The number of disks to move.
         :param source: The name of the source rod.
         :param auxiliary: The name of the auxiliary rod.
         :param target: The name of the target rod.
         """
-        # Base case: If there is only one disk, move it directly.
-        if disks == 1:
-            self.move_disk(source, target)
-        else:
-            # Recursive step 1: Move n-1 disks from source to auxiliary.
-            # The target rod becomes the auxiliary for this subproblem.
-            self.solve(disks - 1, source, target, auxiliary)
+        # There are only six possible moves between three rods, so build their
+        # statements once instead of formatting one per move.
+        for rod_from in (source, auxiliary, target):
+            for rod_to in (source, auxiliary, target):
+                if rod_from != rod_to:
+                    self._messages[(rod_from, rod_to)] = f"Move disk from {rod_from} to {rod_to}"
 
-            # Step 2: Move the largest remaining disk from source to target.
-            self.move_disk(source, target)
+        # Number the rods so that the counter moves the tower onto the target.
+        if disks % 2 == 1:
+            rods = (source, auxiliary, target)
+        else:
+            rods = (source, target, auxiliary)
 
-            # Recursive step 3: Move the n-1 disks from auxiliary to target.
-            # The source rod becomes the auxiliary for this subproblem.
-            self.solve(disks - 1, auxiliary, source, target)
+        # Buffer the statements only for the moves of this call, and write
+        # out what was buffered even if it is interrupted.
+        self._buffering = True
+        try:
+            for move in range(1, 1 << disks):
+                self.move_disk(rods[(move & (move - 1)) % 3], rods[((move | (move - 1)) + 1) % 3])
+        finally:
+            self._buffering = False
+            self.flush()
 
 
 # --- Main Execution Block ---
@@ -29,13 +29,12 @@ class GT:
         pass
     def run(self,file_path)->None:       
         df = pd.read_excel(file_path, engine='openpyxl')
-        A = df.loc[27:45, ['Unnamed: 1']]
-        B = [None] * 10000
+        A = df.loc[27:45, 'Unnamed: 1'].astype(str).tolist()
         url = "https://web-int.u-aizu.ac.jp/thesis/Thesis2024a-Poster/"
 
-        for i in range(len(A)):
-            B[i] = url + "s" + str(A.iloc[i]['Unnamed: 1']) + "/" + str(A.iloc[i]['Unnamed: 1']) + ".pdf"
-            print(B[i])
+        B = [f"{url}s{student_id}/{student_id}.pdf" for student_id in A]
+        if B:
+            sys.stdout.write('\n'.join(B) + '\n')
 
 # Example of how to use the class
 if __name__ == "__main__":
@@ -2,6 +2,11 @@ import sys
 import random
 from pigeonHoleSortAbstract import pigeonHoleSortAbstract
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; fall back to the pure Python loops.
+    np = None
+
 
 class PigeonHoleSort(pigeonHoleSortAbstract):
     """
@@ -11,6 +16,8 @@ class PigeonHoleSort(pigeonHoleSortAbstract):
     command line, taking the number of random elements to sort as an argument.
     """
 
+    __slots__ = ()
+
     def sort(self, arr):
         """
         Sorts a list of numbers using the Pigeonhole Sort algorithm.
@@ -37,6 +44,16 @@ class PigeonHoleSort(pigeonHoleSortAbstract):
         # The range is the difference between max and min values plus one.
         size = max_val - min_val + 1
 
+        # When NumPy is available, count and rebuild the values with C loops.
+        # Very sparse ranges stay on the Python path, where the pigeonholes do
+        # not have to be allocated as a dense array.
+        if np is not None and size <= 10 * len(arr):
+            values = np.asarray(arr)
+            if values.dtype.kind in 'iu':
+                counts = np.bincount(values - min_val)
+                arr[:] = np.repeat(np.arange(size, dtype=values.dtype) + min_val, counts).tolist()
+                return arr
+
         # Create the pigeonholes. Each hole corresponds to a value in the range.
         # Initialize all holes to zero.
         holes = [0] * size
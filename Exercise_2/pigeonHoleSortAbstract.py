@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 
 class pigeonHoleSortAbstract(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def sort(self, arr):
         """
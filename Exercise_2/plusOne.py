@@ -1,18 +1,53 @@
-plusOne = lambda x: x + 1
+def plusOne(x):
+    """
+    Returns the given number incremented by one.
 
-try:
-    # Prompt the user to enter a number.
-    user_input_str = input("Please enter a number: ")
+    :param x: The number to increment.
+    :return: x + 1
+    """
+    return x + 1
 
-    # Convert the user's string input into an integer.
-    number = int(user_input_str)
 
-    # Call the lambda function with the user's number.
-    result = plusOne(number)
+def __getattr__(name):
+    """
+    Creates plusOne_jit, a compiled version of plusOne, on first access.
 
-    # Display the original number and the calculated result.
-    print(f"Input: {number}, Output: {result}")
+    plusOne_jit is meant for callers inside other Numba-compiled code, where
+    it is inlined rather than called through the interpreter. Numba is only
+    imported here, so that running this script or importing plusOne does
+    not pay for it.
 
-except ValueError:
-    # Handle cases where the input is not a valid integer.
-    print("Invalid input. Please enter a valid number.")
\ No newline at end of file
+    :param name: The name of the attribute being looked up.
+    :return: plusOne_jit
+    :raises AttributeError: If name is not plusOne_jit, or Numba is not installed.
+    """
+    if name != 'plusOne_jit':
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    try:
+        from numba import njit
+    except ImportError:  # Numba is optional; plusOne_jit is only available with it.
+        raise AttributeError("plusOne_jit requires Numba, which is not installed.") from None
+
+    # Keep it as a module attribute, so that __getattr__ runs only once.
+    globals()['plusOne_jit'] = njit(cache=True)(plusOne)
+    return globals()['plusOne_jit']
+
+
+if __name__ == "__main__":
+    try:
+        # Prompt the user to enter a number.
+        user_input_str = input("Please enter a number: ")
+
+        # Convert the user's string input into an integer.
+        number = int(user_input_str)
+
+        # Call the plusOne function with the user's number.
+        result = plusOne(number)
+
+        # Display the original number and the calculated result.
+        print(f"Input: {number}, Output: {result}")
+
+    except ValueError:
+        # Handle cases where the input is not a valid integer.
+        print("Invalid input. Please enter a valid number.")
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 
 class tHanoiAbstract(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def move_disk(self, source, target):
         """